@@ -0,0 +1,101 @@
+"""
+Static asset build: bundle, minify, fingerprint and precompress.
+
+For every bundle in app.ASSET_BUNDLES the sources are concatenated in order
+and minified (rcssmin / rjsmin); every file in app.ASSET_FILES is copied (lang packs
+are minified). Outputs are written to static/dist/ as <name>.<contenthash>.<ext>
+with .gz (and .br when brotli is installed) siblings,
+plus manifest.json mapping logical names to hashed paths. app.py serves them from
+/assets/ with immutable one-year caching. A missing source fails the build.
+
+Usage:
+    python build_assets.py
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from typing import Any, Dict
+
+import rcssmin
+import rjsmin
+
+from app import ASSET_BUNDLES, ASSET_DIST_DIR, ASSET_FILES, app
+
+try:
+    import brotli
+except Exception:
+    brotli = None
+
+STATIC_DIR = app.static_folder
+# Already-compressed formats are not worth a .gz/.br sibling
+PRECOMPRESS_EXTS = {".css", ".js", ".json", ".bin", ".svg", ".html"}
+
+def _read(rel: str) -> bytes:
+    with open(os.path.join(STATIC_DIR, rel), "rb") as f:
+        return f.read()
+
+def _flatten(obj: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for key, value in obj.items():
+        full = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            out.update(_flatten(value, full))
+        else:
+            out[full] = value
+    return out
+
+def normalise_lang_pack(raw: bytes) -> bytes:
+    """
+    Minify a lang pack, flattening any nested sections to dotted "a.b" keys
+    (the shape main.js looks up for [data-i18n] elements).
+    """
+    flat = _flatten(json.loads(raw.decode("utf-8")))
+    return json.dumps(flat, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _write_hashed(logical: str, out_rel: str, data: bytes, manifest: Dict[str, str]) -> None:
+    stem, ext = os.path.splitext(out_rel)
+    digest = hashlib.blake2b(data, digest_size=6).hexdigest()
+    hashed = f"{stem}.{digest}{ext}"
+    out_path = os.path.join(ASSET_DIST_DIR, hashed)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "wb") as f:
+        f.write(data)
+    if ext in PRECOMPRESS_EXTS:
+        with open(out_path + ".gz", "wb") as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            with open(out_path + ".br", "wb") as f:
+                f.write(brotli.compress(data, quality=11))
+    manifest[logical] = hashed
+    print(f"{logical:<28} -> {hashed} ({len(data)} bytes)")
+
+def build() -> Dict[str, str]:
+    shutil.rmtree(ASSET_DIST_DIR, ignore_errors=True)
+    os.makedirs(ASSET_DIST_DIR)
+    manifest: Dict[str, str] = {}
+
+    for name, sources in ASSET_BUNDLES.items():
+        parts = [_read(src) for src in sources]
+        if name.endswith(".css"):
+            data = rcssmin.cssmin(b"\n".join(parts))
+        else:
+            # ';' guards against a source that ends without one before the next file
+            data = rjsmin.jsmin(b"\n;\n".join(parts))
+        _write_hashed(name, f"bundles/{name}", data, manifest)
+
+    for rel in ASSET_FILES:
+        data = _read(rel)
+        if rel.startswith("lang/"):
+            data = normalise_lang_pack(data)
+        _write_hashed(rel, rel, data, manifest)
+
+    with open(os.path.join(ASSET_DIST_DIR, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+if __name__ == "__main__":
+    build()
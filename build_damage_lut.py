@@ -0,0 +1,75 @@
+"""
+Offline builder for the precomputed damage lookup table.
+
+Evaluates app.compute_impact() over a (target, diameter, velocity, angle) grid and
+writes a little-endian float32 blob plus a JSON sidecar into static/data/.
+The server memory-maps the blob (see DAMAGE_LUT in app.py) and the browser
+fetches the same files to interpolate slider previews without a round trip.
+
+Usage:
+    python build_damage_lut.py [output.bin]
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+from array import array
+from typing import List
+
+from app import DAMAGE_LUT_PATH, compute_impact
+
+# Slider ranges on the simulation page: diameter 10-5000 m, velocity 5-72 km/s, angle 0-90 deg.
+# Diameter/velocity are log-spaced because every output is a power law in them.
+DIAMETER_RANGE = (10.0, 5000.0, 12)
+VELOCITY_RANGE = (5.0, 72.0, 8)
+ANGLE_STEP_DEG = 5
+
+TARGETS = ["ocean", "land", "coastal"]
+OUTPUTS = ["energy", "crater_diameter", "seismic_magnitude", "tsunami_height", "blast_radius", "affected_population"]
+# Interpolated in log space by the readers; seismic_magnitude is already log-linear.
+LOG_OUTPUTS = ["energy", "crater_diameter", "tsunami_height", "blast_radius", "affected_population"]
+
+def log_space(lo: float, hi: float, n: int) -> List[float]:
+    step = (math.log(hi) - math.log(lo)) / (n - 1)
+    return [round(math.exp(math.log(lo) + k * step), 6) for k in range(n)]
+
+def build(out_path: str) -> None:
+    diameters = log_space(*DIAMETER_RANGE)
+    velocities = log_space(*VELOCITY_RANGE)
+    angles = [float(a) for a in range(0, 91, ANGLE_STEP_DEG)]
+    shape = [len(OUTPUTS), len(TARGETS), len(diameters), len(velocities), len(angles)]
+
+    values = array("f")
+    for name in OUTPUTS:
+        for target in TARGETS:
+            for d in diameters:
+                for v in velocities:
+                    for a in angles:
+                        values.append(compute_impact(d, v, a, target)[name])
+    if sys.byteorder != "little":
+        values.byteswap()
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(out_path, "wb") as f:
+        values.tofile(f)
+
+    meta = {
+        "version": 1,
+        "dtype": "float32",
+        "byte_order": "little",
+        "layout": ["outputs", "targets", "diameter_m", "velocity_km_s", "angle_deg"],
+        "shape": shape,
+        "outputs": OUTPUTS,
+        "log_outputs": LOG_OUTPUTS,
+        "targets": TARGETS,
+        "axes": {"diameter_m": diameters, "velocity_km_s": velocities, "angle_deg": angles},
+    }
+    with open(os.path.splitext(out_path)[0] + ".json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, separators=(",", ":"))
+
+    print(f"Wrote {out_path}: shape={shape}, {len(values) * 4} bytes")
+
+if __name__ == "__main__":
+    build(sys.argv[1] if len(sys.argv) > 1 else DAMAGE_LUT_PATH)
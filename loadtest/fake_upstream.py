@@ -0,0 +1,170 @@
+"""
+Fake upstream server for load testing ImpactX without spending real API quotas.
+
+Replays the JSON fixtures in loadtest/fixtures/ on the same paths as the real
+services (NASA NeoWs, OpenWeather, Nominatim, USGS EPQS + earthquake catalog,
+Google Elevation, Gemini REST), with configurable latency and fault injection.
+
+Point the app at it with the *_URL env vars (see loadtest/run.sh), e.g.:
+    NEO_API_URL=http://127.0.0.1:8089/neo/rest/v1/feed
+
+Usage:
+    python loadtest/fake_upstream.py [--port 8089] [--latency-ms 150] [--jitter-ms 50]
+                                     [--error-rate 0.01] [--rate-429 0.02] [--seed 42]
+    python loadtest/fake_upstream.py --record   # refresh fixtures from the real GET upstreams
+
+Fault settings can be changed at runtime: POST /_fault {"latency_ms": 400, "rate_429": 0.1}.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from flask import Flask, Response, jsonify, request
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# path -> fixture file. Paths mirror the real upstream URLs.
+ROUTES: Dict[str, str] = {
+    "/neo/rest/v1/feed": "neo_feed.json",
+    "/data/2.5/weather": "weather.json",
+    "/reverse": "nominatim_reverse.json",
+    "/v1/json": "usgs_epqs.json",
+    "/maps/api/elevation/json": "google_elevation.json",
+    "/fdsnws/event/1/query": "usgs_earthquakes.json",
+}
+GEMINI_FIXTURE = "gemini_generate_content.json"
+
+# Real GET upstreams used by --record (keys come from the same env vars as app.py).
+RECORD_SOURCES = {
+    "neo_feed.json": ("https://api.nasa.gov/neo/rest/v1/feed",
+                      lambda: {"api_key": os.getenv("NASA_API_KEY", "DEMO_KEY")}),
+    "weather.json": ("http://api.openweathermap.org/data/2.5/weather",
+                     lambda: {"lat": 34.0522, "lon": -118.2437, "units": "metric", "appid": os.getenv("OPENWEATHER_KEY_1", "")}),
+    "nominatim_reverse.json": ("https://nominatim.openstreetmap.org/reverse",
+                               lambda: {"format": "jsonv2", "lat": 34.0522, "lon": -118.2437, "zoom": 10, "addressdetails": 1}),
+    "usgs_epqs.json": ("https://epqs.nationalmap.gov/v1/json",
+                       lambda: {"x": -118.2437, "y": 34.0522, "units": "Meters", "output": "json"}),
+    "usgs_earthquakes.json": ("https://earthquake.usgs.gov/fdsnws/event/1/query",
+                              lambda: {"format": "geojson", "latitude": 34.0522, "longitude": -118.2437,
+                                       "maxradiuskm": 300, "minmagnitude": 4.5, "limit": 50}),
+}
+
+app = Flask(__name__)
+
+_fault: Dict[str, Any] = {"latency_ms": 0.0, "jitter_ms": 0.0, "error_rate": 0.0, "rate_429": 0.0}
+_fixtures: Dict[str, bytes] = {}
+_rng = random.Random(0)
+_rng_lock = threading.Lock()
+_stats: Dict[str, int] = {"requests": 0, "errors": 0, "throttled": 0}
+
+def load_fixtures() -> None:
+    for name in set(ROUTES.values()) | {GEMINI_FIXTURE}:
+        with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+            _fixtures[name] = f.read()
+
+def _draw() -> tuple:
+    """
+    One seeded draw per request (latency, fault roll) so a run with a fixed seed
+    and request order is reproducible.
+    """
+    with _rng_lock:
+        return _rng.gauss(0.0, 1.0), _rng.random()
+
+def _fixture_response(name: str) -> Response:
+    return Response(_fixtures[name], mimetype="application/json")
+
+@app.before_request
+def inject_faults() -> Optional[Response]:
+    if request.path.startswith("/_"):
+        return None
+    noise, roll = _draw()
+    delay_ms = max(0.0, _fault["latency_ms"] + noise * _fault["jitter_ms"])
+    if delay_ms:
+        time.sleep(delay_ms / 1000.0)
+
+    _stats["requests"] += 1
+    if roll < _fault["rate_429"]:
+        _stats["throttled"] += 1
+        resp = jsonify({"error": "Too Many Requests (injected)"})
+        resp.status_code = 429
+        resp.headers["Retry-After"] = "1"
+        return resp
+    if roll < _fault["rate_429"] + _fault["error_rate"]:
+        _stats["errors"] += 1
+        resp = jsonify({"error": "Internal Server Error (injected)"})
+        resp.status_code = 500
+        return resp
+    return None
+
+def _make_view(fixture: str):
+    def view():
+        return _fixture_response(fixture)
+    view.__name__ = f"fixture_{fixture.split('.')[0]}"
+    return view
+
+for _path, _fixture in ROUTES.items():
+    app.add_url_rule(_path, view_func=_make_view(_fixture), methods=["GET"])
+
+@app.route("/v1beta/models/<path:model_method>", methods=["POST"])
+def gemini_generate_content(model_method: str):
+    if not model_method.endswith(":generateContent"):
+        return jsonify({"error": {"code": 404, "message": f"Unsupported method {model_method}"}}), 404
+    return _fixture_response(GEMINI_FIXTURE)
+
+@app.route("/_fault", methods=["GET", "POST"])
+def fault_settings():
+    if request.method == "POST":
+        body = request.get_json(silent=True) or {}
+        for key in _fault:
+            if key in body:
+                _fault[key] = float(body[key])
+    return jsonify({"fault": _fault, "stats": _stats})
+
+def record_fixtures() -> None:
+    """
+    Fetch each real GET upstream once and overwrite its fixture. Gemini (POST) is not recorded.
+    """
+    import requests
+
+    for name, (url, params) in RECORD_SOURCES.items():
+        try:
+            r = requests.get(url, params=params(), timeout=20,
+                             headers={"User-Agent": os.getenv("NOMINATIM_UA", "meteor-madness-app/1.0 (loadtest fixture recording)")})
+            r.raise_for_status()
+            with open(os.path.join(FIXTURE_DIR, name), "w", encoding="utf-8") as f:
+                json.dump(r.json(), f, indent=2)
+            print(f"recorded {name}")
+        except Exception as e:
+            print(f"skipped {name}: {e}")
+        time.sleep(1.0)  # Nominatim policy: max 1 req/s
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.getenv("FAKE_UPSTREAM_PORT", "8089")))
+    parser.add_argument("--latency-ms", type=float, default=float(os.getenv("FAKE_LATENCY_MS", "0")))
+    parser.add_argument("--jitter-ms", type=float, default=float(os.getenv("FAKE_JITTER_MS", "0")))
+    parser.add_argument("--error-rate", type=float, default=float(os.getenv("FAKE_ERROR_RATE", "0")))
+    parser.add_argument("--rate-429", type=float, default=float(os.getenv("FAKE_RATE_429", "0")))
+    parser.add_argument("--seed", type=int, default=int(os.getenv("FAKE_SEED", "42")))
+    parser.add_argument("--record", action="store_true", help="refresh fixtures from the real upstreams and exit")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures()
+        return
+
+    _fault.update(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                  error_rate=args.error_rate, rate_429=args.rate_429)
+    _rng.seed(args.seed)
+    load_fixtures()
+    app.run(host=args.host, port=args.port, threaded=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+# Gunicorn config under test (loadtest/run.sh). Tune via env and compare curves.
+# Note: upstream rate limits in app.py are per worker process.
+import os
+
+bind = os.getenv("GUNICORN_BIND", "127.0.0.1:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+keepalive = 5
+accesslog = None
+loglevel = os.getenv("GUNICORN_LOGLEVEL", "warning")
@@ -0,0 +1,79 @@
+"""
+Locust scenario for ImpactX: page loads, /simulate, /impact_map and /chatbot.
+
+Run through loadtest/run.sh (which starts the fake upstream and gunicorn), or directly:
+    locust -f loadtest/locustfile.py --headless --host http://127.0.0.1:8000 \
+           --csv out/run --csv-full-history
+
+The StepLoad shape adds LOADTEST_STEP_USERS users every LOADTEST_STEP_SECONDS up to
+LOADTEST_MAX_USERS, so the stats history traces a throughput/latency saturation curve
+(summarise it with loadtest/summarize.py). Task choice and inputs are seeded per user
+from LOADTEST_SEED, so the same config replays the same request mix.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import random
+
+from locust import HttpUser, LoadTestShape, between, task
+
+SEED = int(os.getenv("LOADTEST_SEED", "42"))
+STEP_USERS = int(os.getenv("LOADTEST_STEP_USERS", "10"))
+STEP_SECONDS = int(os.getenv("LOADTEST_STEP_SECONDS", "30"))
+MAX_USERS = int(os.getenv("LOADTEST_MAX_USERS", "100"))
+
+PAGES = ["/", "/simulation", "/impact", "/mitigation", "/resources", "/about", "/learn", "/defend"]
+CITIES = [(34.0522, -118.2437), (40.7128, -74.0060), (51.5074, -0.1278), (35.6895, 139.6917), (-22.9068, -43.1729)]
+QUESTIONS = [
+    "How big does an asteroid need to be to cause a tsunami?",
+    "What is a kinetic impactor?",
+    "What should I do if an impact warning is issued?",
+]
+
+_user_ids = itertools.count()
+
+class ImpactXUser(HttpUser):
+    wait_time = between(1, 3)
+
+    def on_start(self):
+        self.rng = random.Random(SEED + next(_user_ids))
+        self.lat, self.lng = self.rng.choice(CITIES)
+
+    @task(10)
+    def page_load(self):
+        self.client.get(self.rng.choice(PAGES), name="page")
+
+    @task(2)
+    def neo_feed(self):
+        self.client.get("/get_neos")
+
+    @task(5)
+    def simulate(self):
+        self.client.post("/simulate", json={
+            "size": self.rng.randint(10, 5000),
+            "speed": self.rng.randint(5, 72),
+            "angle": self.rng.randint(5, 90),
+            "lat": self.lat,
+            "lng": self.lng,
+        })
+
+    @task(3)
+    def impact_map(self):
+        # Session-backed map of the user's last run (reverse geocode + Folium render)
+        self.client.get("/impact_map", headers={"Accept-Encoding": "gzip, br"})
+
+    @task(1)
+    def chatbot(self):
+        self.client.post("/chatbot", json={"message": self.rng.choice(QUESTIONS)})
+
+class StepLoad(LoadTestShape):
+    """
+    Staircase ramp: hold each user level for STEP_SECONDS, stop after MAX_USERS' step.
+    """
+    def tick(self):
+        step = int(self.get_run_time() // STEP_SECONDS) + 1
+        users = step * STEP_USERS
+        if users > MAX_USERS:
+            return None
+        return users, STEP_USERS
@@ -0,0 +1,58 @@
+#!/usr/bin/env bash
+# Reproducible load test: fake upstreams + gunicorn (loadtest/gunicorn.conf.py) + Locust step ramp.
+#
+#   loadtest/run.sh                         # defaults
+#   GUNICORN_WORKERS=4 FAKE_LATENCY_MS=200 FAKE_RATE_429=0.05 loadtest/run.sh
+#
+# Results land in $LOADTEST_OUT (default loadtest/out/<timestamp>/): Locust CSVs + curve.csv.
+set -euo pipefail
+cd "$(dirname "$0")/.."
+
+FAKE_PORT="${FAKE_UPSTREAM_PORT:-8089}"
+FAKE="http://127.0.0.1:${FAKE_PORT}"
+export GUNICORN_BIND="${GUNICORN_BIND:-127.0.0.1:8000}"
+OUT="${LOADTEST_OUT:-loadtest/out/$(date +%Y%m%d-%H%M%S)}"
+mkdir -p "$OUT"
+
+# Point every upstream at the fake server.
+export NEO_API_URL="$FAKE/neo/rest/v1/feed"
+export WEATHER_API_URL="$FAKE/data/2.5/weather"
+export NOMINATIM_URL="$FAKE/reverse"
+export USGS_EPQS_URL="$FAKE/v1/json"
+export USGS_EARTHQUAKE_URL="$FAKE/fdsnws/event/1/query"
+export GOOGLE_ELEVATION_API_URL="$FAKE/maps/api/elevation/json"
+export GEMINI_API_ENDPOINT="$FAKE"
+
+# Keep load-test state away from the real caches.
+export NEO_CACHE_NAME="$OUT/neo_cache"
+export RUNS_DB_PATH="$OUT/runs.sqlite"
+
+# Measure the app, not the politeness limiter (set LOADTEST_REAL_LIMITS=1 to keep policy rates).
+if [ "${LOADTEST_REAL_LIMITS:-0}" != "1" ]; then
+  for name in NOMINATIM NASA OPENWEATHER GEMINI USGS GOOGLE_ELEVATION; do
+    export "${name}_RATE_PER_SEC=100000" "${name}_BURST=100000"
+  done
+fi
+
+python loadtest/fake_upstream.py --port "$FAKE_PORT" \
+  --latency-ms "${FAKE_LATENCY_MS:-100}" --jitter-ms "${FAKE_JITTER_MS:-30}" \
+  --error-rate "${FAKE_ERROR_RATE:-0}" --rate-429 "${FAKE_RATE_429:-0}" --seed "${FAKE_SEED:-42}" \
+  > "$OUT/fake_upstream.log" 2>&1 &
+FAKE_PID=$!
+gunicorn -c loadtest/gunicorn.conf.py app:app > "$OUT/gunicorn.log" 2>&1 &
+APP_PID=$!
+trap 'kill $FAKE_PID $APP_PID 2>/dev/null || true' EXIT
+
+for url in "$FAKE/_fault" "http://$GUNICORN_BIND/"; do
+  for _ in $(seq 1 50); do
+    curl -fs -o /dev/null "$url" && break
+    sleep 0.2
+  done
+done
+
+locust -f loadtest/locustfile.py --headless --host "http://$GUNICORN_BIND" \
+  --csv "$OUT/run" --csv-full-history --only-summary
+
+python loadtest/summarize.py "$OUT/run_stats_history.csv" --out "$OUT/curve.csv"
+curl -fs "$FAKE/_fault" > "$OUT/fake_upstream_stats.json" || true
+echo "Results in $OUT"
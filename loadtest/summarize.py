@@ -0,0 +1,63 @@
+"""
+Reduce a Locust *_stats_history.csv into one row per user level (a saturation curve).
+
+Usage:
+    python loadtest/summarize.py out/run_stats_history.csv [--out out/curve.csv]
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import statistics
+from collections import OrderedDict
+from typing import Dict, List
+
+def _num(val: str) -> float:
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return 0.0
+
+def summarize(history_path: str) -> List[Dict[str, float]]:
+    levels: "OrderedDict[int, List[Dict[str, str]]]" = OrderedDict()
+    with open(history_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row.get("Name") != "Aggregated":
+                continue
+            users = int(_num(row.get("User Count")))
+            if users > 0:
+                levels.setdefault(users, []).append(row)
+
+    curve = []
+    for users, rows in levels.items():
+        # Skip the first sample of each step: it still mixes in the previous level.
+        steady = rows[1:] or rows
+        curve.append({
+            "users": users,
+            "rps": round(statistics.mean(_num(r["Requests/s"]) for r in steady), 2),
+            "fail_per_s": round(statistics.mean(_num(r["Failures/s"]) for r in steady), 2),
+            "p50_ms": round(statistics.median(_num(r["50%"]) for r in steady), 1),
+            "p95_ms": round(statistics.median(_num(r["95%"]) for r in steady), 1),
+            "p99_ms": round(statistics.median(_num(r["99%"]) for r in steady), 1),
+        })
+    return curve
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Locust stats history -> saturation curve")
+    parser.add_argument("history")
+    parser.add_argument("--out", help="also write the curve as CSV")
+    args = parser.parse_args()
+
+    curve = summarize(args.history)
+    cols = ["users", "rps", "fail_per_s", "p50_ms", "p95_ms", "p99_ms"]
+    print("  ".join(f"{c:>10}" for c in cols))
+    for point in curve:
+        print("  ".join(f"{point[c]:>10}" for c in cols))
+    if args.out:
+        with open(args.out, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=cols)
+            writer.writeheader()
+            writer.writerows(curve)
+
+if __name__ == "__main__":
+    main()
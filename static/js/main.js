@@ -132,6 +132,56 @@ document.addEventListener('DOMContentLoaded', function () {
     }
 
 
+    // --- Static Assets & Localisation ---
+
+    // Fingerprinted URLs from the asset manifest (window.ASSET_URLS, set in base.html);
+    // falls back to the unhashed /static path when build_assets.py has not been run.
+    function assetUrl(name) {
+        return (window.ASSET_URLS && window.ASSET_URLS[name]) || `/static/${name}`;
+    }
+
+    // English ships inline in the templates; other locales are fetched only when selected.
+    const langPacks = {};
+
+    function loadLangPack(locale) {
+        if (!langPacks[locale]) {
+            langPacks[locale] = fetch(assetUrl(`lang/${locale}.json`))
+                .then(r => { if (!r.ok) throw new Error(r.status); return r.json(); })
+                .catch(error => {
+                    console.warn(`Language pack '${locale}' unavailable:`, error);
+                    delete langPacks[locale];
+                    return null;
+                });
+        }
+        return langPacks[locale];
+    }
+
+    async function setLocale(locale) {
+        localStorage.setItem('lang', locale);
+        document.documentElement.lang = locale;
+        const elements = document.querySelectorAll('[data-i18n]');
+        if (locale === 'en') {
+            elements.forEach(el => { if (el.dataset.i18nDefault) el.textContent = el.dataset.i18nDefault; });
+            return;
+        }
+        const pack = await loadLangPack(locale);
+        if (!pack) return;
+        elements.forEach(el => {
+            const text = pack[el.dataset.i18n];
+            if (text === undefined) return;
+            if (!el.dataset.i18nDefault) el.dataset.i18nDefault = el.textContent;
+            el.textContent = text;
+        });
+    }
+    window.setLocale = setLocale;
+
+    function initLocale() {
+        const requested = new URLSearchParams(window.location.search).get('lang');
+        const locale = requested || localStorage.getItem('lang');
+        if (locale && locale !== 'en') setLocale(locale);
+        else if (requested) localStorage.setItem('lang', 'en');
+    }
+
     // --- Page-specific Initialization ---
 
     const currentPage = window.location.pathname;
@@ -157,6 +207,7 @@ document.addEventListener('DOMContentLoaded', function () {
             setupLearnPage();
         }
         updateRealTimeClock();
+        initLocale();
     }
     
     // --- Visualization Functions ---
@@ -227,7 +278,7 @@ document.addEventListener('DOMContentLoaded', function () {
             }
         });
         
-        fetch(`https://nominatim.openstreetmap.org/reverse?format=jsonv2&lat=${lat}&lon=${lng}`)
+        fetch(`/api/reverse_geocode?lat=${lat}&lon=${lng}&zoom=18`)
             .then(response => response.json())
             .then(data => {
                 const address = data.address;
@@ -311,6 +362,69 @@ document.addEventListener('DOMContentLoaded', function () {
         }
     }
 
+    // --- Damage Lookup Table (static/data/damage_lut.*, built by build_damage_lut.py) ---
+    let damageLutPromise = null;
+
+    function loadDamageLut() {
+        if (!damageLutPromise) {
+            damageLutPromise = Promise.all([
+                fetch(assetUrl('data/damage_lut.json')).then(r => { if (!r.ok) throw new Error(r.status); return r.json(); }),
+                fetch(assetUrl('data/damage_lut.bin')).then(r => { if (!r.ok) throw new Error(r.status); return r.arrayBuffer(); })
+            ]).then(([meta, buffer]) => {
+                meta.values = new Float32Array(buffer);
+                return meta;
+            }).catch(error => {
+                console.warn("Damage lookup table unavailable:", error);
+                return null;
+            });
+        }
+        return damageLutPromise;
+    }
+
+    function lutBracket(axis, x, logAxis) {
+        if (!(x >= axis[0] && x <= axis[axis.length - 1])) return null;
+        let lo = 0, hi = axis.length - 1;
+        while (hi - lo > 1) {
+            const mid = (lo + hi) >> 1;
+            if (axis[mid] <= x) lo = mid; else hi = mid;
+        }
+        let a0 = axis[lo], a1 = axis[hi];
+        if (logAxis) { a0 = Math.log(a0); a1 = Math.log(a1); x = Math.log(x); }
+        return [lo, a1 !== a0 ? (x - a0) / (a1 - a0) : 0];
+    }
+
+    // Mirrors damage_lut_lookup() in app.py.
+    function damageLutLookup(lut, diameter, velocity, angle, target) {
+        const tIdx = lut.targets.indexOf(target);
+        const bd = lutBracket(lut.axes.diameter_m, diameter, true);
+        const bv = lutBracket(lut.axes.velocity_km_s, velocity, true);
+        const ba = lutBracket(lut.axes.angle_deg, angle, false);
+        if (tIdx < 0 || !bd || !bv || !ba) return null;
+
+        const [, nT, nD, nV, nA] = lut.shape;
+        const out = {};
+        lut.outputs.forEach((name, oIdx) => {
+            const useLog = lut.log_outputs.includes(name);
+            const base = (oIdx * nT + tIdx) * nD;
+            let linSum = 0, logSum = 0, allPositive = true;
+            for (let dd = 0; dd < 2; dd++) {
+                const wd = dd ? bd[1] : 1 - bd[1];
+                for (let dv = 0; dv < 2; dv++) {
+                    const wv = dv ? bv[1] : 1 - bv[1];
+                    const row = ((base + Math.min(bd[0] + dd, nD - 1)) * nV + Math.min(bv[0] + dv, nV - 1)) * nA;
+                    for (let da = 0; da < 2; da++) {
+                        const w = wd * wv * (da ? ba[1] : 1 - ba[1]);
+                        const v = lut.values[row + Math.min(ba[0] + da, nA - 1)];
+                        linSum += w * v;
+                        if (v > 0) logSum += w * Math.log(v); else allPositive = false;
+                    }
+                }
+            }
+            out[name] = useLog && allPositive ? Math.exp(logSum) : linSum;
+        });
+        return out;
+    }
+
     function setupSimulationControls() {
         const sizeSlider = document.getElementById('asteroid-size');
         const speedSlider = document.getElementById('asteroid-speed');
@@ -325,11 +439,28 @@ document.addEventListener('DOMContentLoaded', function () {
         const orbOmegaPeri = document.getElementById('orb-omega-peri');
         const orbNu = document.getElementById('orb-nu');
 
+        const previewEl = document.getElementById('lut-preview');
+
+        // Slider preview: interpolate the precomputed damage table locally.
+        // Exact numbers still come from POST /simulate when the run button is pressed;
+        // /simulate always models an ocean target at constant depth, so the preview does too.
+        const updatePreview = async () => {
+            if (!previewEl || !sizeSlider || !speedSlider || !angleSlider) return;
+            const lut = await loadDamageLut();
+            const est = lut && damageLutLookup(lut, parseFloat(sizeSlider.value), parseFloat(speedSlider.value), parseFloat(angleSlider.value), 'ocean');
+            if (!est) {
+                previewEl.textContent = '';
+                return;
+            }
+            previewEl.textContent = `Estimate: ${est.energy.toLocaleString(undefined, { maximumFractionDigits: 2 })} MT · crater ${est.crater_diameter.toFixed(2)} km · blast ${est.blast_radius.toFixed(2)} km · M${Math.max(0, est.seismic_magnitude).toFixed(1)}`;
+        };
+
         const setupSlider = (slider, display, unit) => {
             if (slider && document.getElementById(display)) {
                 slider.addEventListener('input', () => {
                     document.getElementById(display).textContent = `${slider.value} ${unit}`;
                     if (neoSelect) neoSelect.value = 'custom';
+                    updatePreview();
                 });
                 document.getElementById(display).textContent = `${slider.value} ${unit}`;
             }
@@ -338,6 +469,7 @@ document.addEventListener('DOMContentLoaded', function () {
         setupSlider(sizeSlider, 'size-value', 'm');
         setupSlider(speedSlider, 'speed-value', 'km/s');
         setupSlider(angleSlider, 'angle-value', '°');
+        updatePreview();
 
         if (neoSelect) {
             neoSelect.addEventListener('change', (event) => {
@@ -793,7 +925,8 @@ document.addEventListener('DOMContentLoaded', function () {
                  const response = await fetch('/simulate', {
                      method: 'POST',
                      headers: { 'Content-Type': 'application/json' },
-                     body: JSON.stringify(finalParams)
+                     // Game rounds stay out of the saved run history
+                     body: JSON.stringify({ ...finalParams, save: false })
                  });
                  const results = await response.json();
                  
@@ -1072,7 +1205,7 @@ document.addEventListener('DOMContentLoaded', function () {
                 navigator.geolocation.getCurrentPosition(position => {
                     const lat = position.coords.latitude;
                     const lon = position.coords.longitude;
-                    fetch(`https://nominatim.openstreetmap.org/reverse?format=jsonv2&lat=${lat}&lon=${lon}`)
+                    fetch(`/api/reverse_geocode?lat=${lat}&lon=${lon}`)
                         .then(response => response.json())
                         .then(data => {
                             const address = data.address;
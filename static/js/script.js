@@ -228,7 +228,7 @@
     navigator.geolocation.getCurrentPosition(
       async ({ coords }) => {
         try {
-          const url = `https://nominatim.openstreetmap.org/reverse?format=jsonv2&lat=${coords.latitude}&lon=${coords.longitude}`;
+          const url = `/api/reverse_geocode?lat=${coords.latitude}&lon=${coords.longitude}`;
           const data = await getJSON(url);
           const addr = data.address || {};
           const city = addr.city || addr.town || addr.village || addr.county || "";
@@ -492,7 +492,7 @@
     const nameEl = $("#current-location-city-country");
     const addrEl = $("#current-location-address");
     try {
-      const url = `https://nominatim.openstreetmap.org/reverse?format=jsonv2&lat=${lat}&lon=${lng}`;
+      const url = `/api/reverse_geocode?lat=${lat}&lon=${lng}&zoom=18`;
       const data = await getJSON(url);
       const addr = data.address || {};
       const city = addr.city || addr.town || addr.village || addr.county || "N/A";
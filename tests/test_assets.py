@@ -0,0 +1,47 @@
+"""
+Static asset pipeline: per-page CSS bundles and the manifest freshness check.
+Run with: python -m pytest tests
+"""
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as impactx  # noqa: E402
+
+@pytest.mark.parametrize("bundle", [b for b in impactx.ASSET_BUNDLES if b.endswith(".css")])
+def test_css_bundles_include_each_sheet_once(bundle):
+    sources = impactx.ASSET_BUNDLES[bundle]
+    assert len(sources) == len(set(sources))
+    if bundle != "site.css":
+        assert sources[-1] == f"css/{bundle}"  # the page's own rules still win the cascade
+
+@pytest.fixture
+def fake_manifest(tmp_path, monkeypatch):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text("{}")
+    monkeypatch.setattr(impactx, "ASSET_MANIFEST_PATH", str(manifest))
+    monkeypatch.setattr(impactx, "ASSET_MANIFEST", {"about.css": "bundles/about.0123456789ab.css"})
+    monkeypatch.setattr(impactx, "ASSET_BUILD_MODE", "auto")
+    monkeypatch.setitem(impactx._asset_state, "checked", 0.0)
+    monkeypatch.setitem(impactx._asset_state, "fresh", True)
+    return manifest
+
+def _stylesheets(client, path):
+    return re.findall(r'rel="stylesheet" href="(/(?:assets|static)/[^"]+)"', client.get(path).get_data(as_text=True))
+
+def test_fresh_manifest_links_one_bundle_per_page(fake_manifest):
+    newest = impactx._asset_sources_mtime()
+    os.utime(fake_manifest, (newest + 1, newest + 1))
+    assert _stylesheets(impactx.app.test_client(), "/about") == ["/assets/bundles/about.0123456789ab.css"]
+
+def test_stale_manifest_falls_back_to_static_sources(fake_manifest, monkeypatch):
+    os.utime(fake_manifest, (0, 0))
+    links = _stylesheets(impactx.app.test_client(), "/about")
+    assert links == [f"/static/{src}" for src in impactx.ASSET_BUNDLES["about.css"]]
+
+    monkeypatch.setattr(impactx, "ASSET_BUILD_MODE", "1")  # forced on: stale or not
+    assert _stylesheets(impactx.app.test_client(), "/about") == ["/assets/bundles/about.0123456789ab.css"]
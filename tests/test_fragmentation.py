@@ -0,0 +1,41 @@
+"""
+Reference airbursts for the fragmentation engine (POST /simulate/fragmentation).
+Run with: python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import aggregate_fragment_footprint, app, simulate_fragmentation  # noqa: E402
+
+def test_tunguska_class_airburst_has_ground_footprint():
+    # ~60 m stony body at 15 km/s, 45 deg: bursts at ~6 km with several MT
+    frag = simulate_fragmentation(60.0, 15.0, 45.0)
+    footprint = aggregate_fragment_footprint(frag)
+    assert frag["airburst"].all()
+    assert frag["blast_energy_j"].sum() / 4.184e15 > 3.0
+    assert footprint["union_area_km2"] > 100.0
+    assert footprint["extent_km"] is not None
+
+def test_fragment_cloud_footprint_overlaps():
+    client = app.test_client()
+    body = {"size": 400, "speed": 17, "angle": 45, "fragments": 500, "spread_km": 5, "seed": 1}
+    result = client.post("/simulate/fragmentation", json=body).get_json()
+    assert result["footprint"]["union_area_km2"] > 0
+    assert result["footprint"]["max_overlap"] > 1
+    assert result["footprint"]["affected_population"] > 0
+
+def test_invalid_seed_is_rejected():
+    client = app.test_client()
+    for seed in ["x", -1, 1.5]:
+        response = client.post("/simulate/fragmentation", json={"size": 60, "speed": 15, "seed": seed})
+        assert response.status_code == 400
+    assert client.post("/simulate/fragmentation", json={"size": 60, "speed": 15, "seed": "7"}).status_code == 200
+
+def test_invalid_fragment_count_is_rejected():
+    client = app.test_client()
+    for fragments in ["nan", "NaN", "Infinity", "-Infinity", 2.5, 0, 10 ** 6, "x"]:
+        response = client.post("/simulate/fragmentation", json={"size": 60, "speed": 15, "fragments": fragments})
+        assert response.status_code == 400, fragments
+    assert client.post("/simulate/fragmentation", json={"size": 60, "speed": 15, "fragments": "3"}).status_code == 200
@@ -0,0 +1,141 @@
+"""
+Upstream rate limiting: TokenBucket, single-flight coalesce() and the approximate
+reverse-geocode fallback.
+Run with: python -m pytest tests
+"""
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as impactx  # noqa: E402
+from app import TokenBucket, UpstreamUnavailable, coalesce  # noqa: E402
+
+def _drained_bucket() -> TokenBucket:
+    bucket = TokenBucket(rate_per_sec=0.01, burst=1)
+    assert bucket.acquire(0.0)
+    return bucket
+
+def test_token_bucket_serves_waiters_in_arrival_order():
+    bucket = TokenBucket(rate_per_sec=20.0, burst=1)
+    assert bucket.acquire(0.0)
+    finished = []
+
+    def worker(i):
+        assert bucket.acquire(1.0)
+        finished.append((i, time.monotonic()))
+
+    threads = []
+    for i in range(4):
+        t = threading.Thread(target=worker, args=(i,))
+        t.start()
+        threads.append(t)
+        time.sleep(0.005)  # fix the arrival order
+    for t in threads:
+        t.join()
+
+    assert [i for i, _ in finished] == [0, 1, 2, 3]
+    gaps = [b - a for (_, a), (_, b) in zip(finished, finished[1:])]
+    assert all(gap >= 0.03 for gap in gaps)  # each waiter got its own 50 ms slot
+
+def test_token_bucket_refuses_past_deadline_without_spending_a_token():
+    bucket = TokenBucket(rate_per_sec=5.0, burst=1)
+    assert bucket.acquire(0.0)
+    started = time.monotonic()
+    assert bucket.acquire(0.05) is False
+    assert time.monotonic() - started < 0.05  # refused up front, not after sleeping
+    assert bucket.acquire(0.5)  # the refused caller did not push the next slot back
+
+def test_coalesce_followers_share_the_leaders_result():
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(2.0)
+        return {"value": 42}
+
+    def caller():
+        results.append(coalesce("test:shared", fetch, wait_s=2.0))
+
+    threads = [threading.Thread(target=caller) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5 and all(r is results[0] for r in results)
+
+def test_coalesce_followers_share_the_leaders_error():
+    release = threading.Event()
+    errors = []
+
+    def fetch():
+        release.wait(2.0)
+        raise ValueError("upstream exploded")
+
+    def caller():
+        try:
+            coalesce("test:error", fetch, wait_s=2.0)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=caller) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 3 and all(e is errors[0] for e in errors)
+
+def test_coalesce_follower_gives_up_after_wait():
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: coalesce("test:slow", lambda: release.wait(2.0)))
+    leader.start()
+    time.sleep(0.05)
+    try:
+        with pytest.raises(UpstreamUnavailable):
+            coalesce("test:slow", lambda: None, wait_s=0.05)
+    finally:
+        release.set()
+        leader.join()
+
+@pytest.fixture
+def saturated_nominatim(monkeypatch):
+    monkeypatch.setitem(impactx.UPSTREAM_LIMITS, "nominatim", _drained_bucket())
+    monkeypatch.setattr(impactx, "UPSTREAM_DEADLINE_S", 0.05)
+    impactx._geocode_cache.clear()
+    yield
+    impactx._geocode_cache.clear()
+
+def test_reverse_geocode_falls_back_to_nearest_cached_place(saturated_nominatim):
+    place = {"display_name": "Los Angeles, California, United States", "address": {"city": "Los Angeles"}}
+    impactx._geocode_cache_put((34.052, -118.244, 10), place)
+
+    result = impactx.reverse_geocode(34.10, -118.30)
+
+    assert result["approximate"] is True
+    assert result["display_name"] == place["display_name"]
+    assert 0 < result["approximate_distance_km"] <= impactx.GEOCODE_APPROX_KM
+
+def test_reverse_geocode_falls_back_to_coordinate_stub(saturated_nominatim):
+    result = impactx.reverse_geocode(-33.8688, 151.2093)
+    assert result["approximate"] is True
+    assert "address" not in result
+    assert result["display_name"].startswith("Lat: -33.8688")
+
+def test_chatbot_answers_503_when_gemini_is_saturated(monkeypatch):
+    monkeypatch.setitem(impactx.UPSTREAM_LIMITS, "gemini", _drained_bucket())
+    monkeypatch.setattr(impactx, "UPSTREAM_DEADLINE_S", 0.05)
+    response = impactx.app.test_client().post("/chatbot", json={"message": "What is a kinetic impactor?"})
+    assert response.status_code == 503
@@ -0,0 +1,150 @@
+"""
+Run history: keyset pagination, filters, per-user isolation, compare and export formats.
+Run with: python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as impactx  # noqa: E402
+
+SIZES = [50, 120, 300, 80, 900, 200, 40, 650]
+
+@pytest.fixture
+def runs_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(impactx, "RUNS_DB_PATH", str(tmp_path / "runs.sqlite"))
+    impactx.init_runs_db()
+
+def _simulate(client, size, **extra):
+    body = {"size": size, "speed": 20, "angle": 45, "lat": 10.0 + size / 100.0, "lng": 20.0}
+    body.update(extra)
+    response = client.post("/simulate", json=body)
+    assert response.status_code == 200
+    return response.get_json()
+
+def _page_through(client, query, limit):
+    ids, cursor = [], None
+    while True:
+        url = f"/api/runs?{query}&limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200
+        page = response.get_json()
+        ids.extend(run["id"] for run in page["runs"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return ids
+
+@pytest.mark.parametrize("order", ["time", "energy"])
+def test_keyset_pages_are_stable_under_concurrent_inserts(runs_db, order):
+    client = impactx.app.test_client()
+    run_ids = [_simulate(client, size)["run_id"] for size in SIZES]
+
+    first = client.get(f"/api/runs?order={order}&limit=3").get_json()
+    # A new run lands between page requests; it must not shift or repeat later pages.
+    _simulate(client, 10)
+    seen = [run["id"] for run in first["runs"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = client.get(f"/api/runs?order={order}&limit=3&cursor={cursor}").get_json()
+        seen.extend(run["id"] for run in page["runs"])
+        cursor = page["next_cursor"]
+
+    expected_new_run = 1 if order == "energy" else 0  # 10 m is the lowest energy, so it sorts last
+    assert len(seen) == len(set(seen)) == len(run_ids) + expected_new_run
+    assert set(run_ids) <= set(seen)
+
+    rows = client.get(f"/api/runs?order={order}&limit=100").get_json()["runs"]
+    key = "created_at" if order == "time" else "energy"
+    assert [r[key] for r in rows] == sorted((r[key] for r in rows), reverse=True)
+
+def test_energy_filter_and_order(runs_db):
+    client = impactx.app.test_client()
+    results = [_simulate(client, size) for size in SIZES]
+    threshold = sorted(r["energy"] for r in results)[len(results) // 2]
+
+    ids = _page_through(client, f"order=energy&min_energy={threshold}", limit=2)
+    expected = [r["run_id"] for r in sorted(results, key=lambda r: -r["energy"]) if r["energy"] >= threshold]
+    assert ids == expected
+
+@pytest.mark.parametrize("cursor", ["garbage", "1.5", "abc~def"])
+def test_bad_cursor_is_rejected(runs_db, cursor):
+    client = impactx.app.test_client()
+    _simulate(client, 100)
+    assert client.get(f"/api/runs?cursor={cursor}").status_code == 400
+    assert client.get(f"/api/runs/export?cursor={cursor}").status_code == 400
+
+def test_runs_are_isolated_per_user(runs_db):
+    alice, bob = impactx.app.test_client(), impactx.app.test_client()
+    alice_ids = [_simulate(alice, size)["run_id"] for size in SIZES[:3]]
+    bob_id = _simulate(bob, 75)["run_id"]
+
+    assert [r["id"] for r in bob.get("/api/runs").get_json()["runs"]] == [bob_id]
+    assert set(_page_through(alice, "order=time", limit=2)) == set(alice_ids)
+    assert bob.get(f"/api/runs/{alice_ids[0]}").status_code == 404
+    assert bob.get(f"/impact_map?run_id={alice_ids[0]}").status_code == 404
+
+    response = bob.get(f"/api/runs/compare?ids={bob_id},{alice_ids[0]}")
+    assert response.status_code == 404
+    assert response.get_json()["missing"] == [alice_ids[0]]
+
+def test_compare_diffs_against_the_first_run(runs_db):
+    client = impactx.app.test_client()
+    base, other = _simulate(client, 100), _simulate(client, 200)
+    body = client.get(f"/api/runs/compare?ids={base['run_id']},{other['run_id']}").get_json()
+    assert body["baseline_id"] == base["run_id"]
+    assert [r["id"] for r in body["runs"]] == [base["run_id"], other["run_id"]]
+
+def test_unsaved_runs_stay_out_of_history(runs_db):
+    client = impactx.app.test_client()
+    result = _simulate(client, 100, save=False)
+    assert "run_id" not in result
+    assert client.get("/api/runs").get_json()["runs"] == []
+
+def _expected_columns(client):
+    rows = client.get("/api/runs?limit=100").get_json()["runs"]
+    return {c: [row[c] for row in rows] for c in impactx.RUN_COLUMNS}
+
+def test_export_json_is_column_major(runs_db):
+    client = impactx.app.test_client()
+    for size in SIZES:
+        _simulate(client, size)
+    body = client.get("/api/runs/export").get_json()
+    assert body["columns"] == impactx.RUN_COLUMNS
+    assert dict(zip(body["columns"], body["data"])) == _expected_columns(client)
+
+def test_export_msgpack_is_column_major(runs_db):
+    msgpack = pytest.importorskip("msgpack")
+    client = impactx.app.test_client()
+    for size in SIZES:
+        _simulate(client, size)
+    response = client.get("/api/runs/export?format=msgpack")
+    assert response.mimetype == "application/msgpack"
+    body = msgpack.unpackb(response.data)
+    assert dict(zip(body["columns"], body["data"])) == _expected_columns(client)
+
+def test_export_arrow(runs_db):
+    pa = pytest.importorskip("pyarrow")
+    client = impactx.app.test_client()
+    for size in SIZES:
+        _simulate(client, size)
+    response = client.get("/api/runs/export", headers={"Accept": "application/vnd.apache.arrow.stream"})
+    assert response.mimetype == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.data).read_all()
+    assert table.column_names == impactx.RUN_COLUMNS
+    assert table.to_pydict() == _expected_columns(client)
+
+def test_export_pages_with_cursor_header(runs_db):
+    client = impactx.app.test_client()
+    run_ids = [_simulate(client, size)["run_id"] for size in SIZES]
+    first = client.get("/api/runs/export?limit=5")
+    second = client.get(f"/api/runs/export?limit=5&cursor={first.headers['X-Next-Cursor']}")
+    assert "X-Next-Cursor" not in second.headers
+    exported = first.get_json()["data"][0] + second.get_json()["data"][0]
+    assert sorted(exported) == sorted(run_ids)
+
+def test_export_rejects_unknown_format(runs_db):
+    client = impactx.app.test_client()
+    assert client.get("/api/runs/export?format=xml").status_code == 400